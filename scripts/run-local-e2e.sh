@@ -27,57 +27,98 @@ NC='\033[0m'
 echo -e "${YELLOW}=== Building debugger CLI ===${NC}"
 cargo build --release
 DEBUGGER="./target/release/debugger"
+JS_DEBUG_DIR="${XDG_DATA_HOME:-$HOME/.local/share}/debugger-cli/adapters/js-debug"
+FIXTURES_DIR="tests/fixtures"
+E2E_DIR="tests/e2e"
+
+# Check for js-debug's DAP server where `debugger setup js-debug` installs it
+js_debug_installed() {
+    local pkg="$JS_DEBUG_DIR/node_modules/@vscode/js-debug"
+    [ -f "$pkg/src/dapDebugServer.js" ] || [ -f "$pkg/dist/src/dapDebugServer.js" ]
+}
 
 # Check which adapters are available
 check_adapter() {
     local name="$1"
     case "$name" in
         lldb)
-            which lldb-dap >/dev/null 2>&1 || which lldb-vscode >/dev/null 2>&1
+            command -v lldb-dap >/dev/null || command -v lldb-vscode >/dev/null
             ;;
         delve)
-            which dlv >/dev/null 2>&1
+            command -v dlv >/dev/null
             ;;
         debugpy)
             python3 -c "import debugpy" 2>/dev/null
             ;;
         js-debug)
             # Check if js-debug is installed via our setup
-            [ -d ~/.local/share/debugger/adapters/js-debug ] || \
+            js_debug_installed || \
             $DEBUGGER setup js-debug --check >/dev/null 2>&1
             ;;
         gdb)
-            which gdb >/dev/null 2>&1
+            command -v gdb >/dev/null
             ;;
     esac
 }
 
+# Build a fixture unless its output is already newer than its source.
+# A failed build is reported with the compiler's stderr but does not abort the run.
+# Usage: build_fixture <source> <output> <command...>
+build_fixture() {
+    local src="$1" out="$2" err
+    shift 2
+    [ "$out" -nt "$src" ] && return 0
+    if ! err=$("$@" 2>&1 >/dev/null); then
+        echo -e "${RED}  Failed to build ${out}:${NC}" >&2
+        echo "$err" >&2
+    fi
+}
+
 # Compile test fixtures
+# Each toolchain builds in its own background job; they write disjoint outputs.
 compile_fixtures() {
     echo -e "${BLUE}=== Compiling test fixtures ===${NC}"
 
-    # C
-    if which gcc >/dev/null 2>&1; then
-        gcc -g tests/fixtures/simple.c -o tests/fixtures/test_simple_c 2>/dev/null || true
-        gcc -g tests/e2e/hello_world.c -o tests/e2e/test_c 2>/dev/null || true
+    # C (through ccache when available)
+    if command -v gcc >/dev/null; then
+        local cc="gcc"
+        if command -v ccache >/dev/null; then
+            cc="ccache gcc"
+        fi
+        (
+            build_fixture "$FIXTURES_DIR/simple.c" "$FIXTURES_DIR/test_simple_c" \
+                $cc -g "$FIXTURES_DIR/simple.c" -o "$FIXTURES_DIR/test_simple_c"
+            build_fixture "$E2E_DIR/hello_world.c" "$E2E_DIR/test_c" \
+                $cc -g "$E2E_DIR/hello_world.c" -o "$E2E_DIR/test_c"
+        ) &
     fi
 
     # Rust
-    if which rustc >/dev/null 2>&1; then
-        rustc -g tests/fixtures/simple.rs -o tests/fixtures/test_simple_rs 2>/dev/null || true
-        rustc -g tests/e2e/hello_world.rs -o tests/e2e/test_rs 2>/dev/null || true
+    if command -v rustc >/dev/null; then
+        (
+            build_fixture "$FIXTURES_DIR/simple.rs" "$FIXTURES_DIR/test_simple_rs" \
+                rustc -g "$FIXTURES_DIR/simple.rs" -o "$FIXTURES_DIR/test_simple_rs"
+            build_fixture "$E2E_DIR/hello_world.rs" "$E2E_DIR/test_rs" \
+                rustc -g "$E2E_DIR/hello_world.rs" -o "$E2E_DIR/test_rs"
+        ) &
     fi
 
     # Go
-    if which go >/dev/null 2>&1; then
-        go build -gcflags='all=-N -l' -o tests/e2e/test_go tests/e2e/hello_world.go 2>/dev/null || true
-        go build -gcflags='all=-N -l' -o tests/fixtures/test_simple_go tests/fixtures/simple.go 2>/dev/null || true
+    if command -v go >/dev/null; then
+        (
+            build_fixture "$E2E_DIR/hello_world.go" "$E2E_DIR/test_go" \
+                go build -gcflags='all=-N -l' -o "$E2E_DIR/test_go" "$E2E_DIR/hello_world.go"
+            build_fixture "$FIXTURES_DIR/simple.go" "$FIXTURES_DIR/test_simple_go" \
+                go build -gcflags='all=-N -l' -o "$FIXTURES_DIR/test_simple_go" "$FIXTURES_DIR/simple.go"
+        ) &
     fi
 
     # TypeScript
-    if which npx >/dev/null 2>&1; then
-        (cd tests/fixtures && npm install 2>/dev/null && npx tsc 2>/dev/null) || true
+    if command -v npx >/dev/null; then
+        (cd "$FIXTURES_DIR" && npm install 2>/dev/null && npx tsc 2>/dev/null) || true &
     fi
+
+    wait
 }
 
 # Run tests for an adapter
@@ -132,8 +173,8 @@ run_adapter_tests() {
             done
             ;;
         js-debug)
-            # Setup js-debug if not installed
-            $DEBUGGER setup js-debug 2>/dev/null || true
+            # Setup js-debug if not installed (skip the extra spawn when it is)
+            js_debug_installed || $DEBUGGER setup js-debug 2>/dev/null || true
 
             for scenario in hello_world_js hello_world_ts stepping_js expression_eval_js; do
                 if [ -f "tests/scenarios/${scenario}.yml" ]; then
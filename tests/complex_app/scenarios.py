@@ -10,12 +10,11 @@ def recursive_depth(n):
 
 def create_large_data():
     # deeply nested dict
-    data = {"level": 0}
-    current = data
-    for i in range(100):
-        current["next"] = {"level": i + 1}
-        current = current["next"]
-    
+    levels = [{"level": i} for i in range(101)]
+    for parent, child in zip(levels, levels[1:]):
+        parent["next"] = child
+    data = levels[0]
+
     # large list
     large_list = list(range(10000))
     
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     name: str
     age: int
@@ -34,32 +34,37 @@ class Calculator:
         return result
 
     def factorial(self, n: int) -> int:
-        """Recursive factorial for testing step-into."""
-        if n <= 1:
-            return 1
-        return n * self.factorial(n - 1)
+        """Iterative factorial for testing step-into."""
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        self.history.append(f"{n}! = {result}")
+        return result
 
 
 def fibonacci(n: int) -> int:
-    """Iterative fibonacci for testing loops."""
-    if n <= 1:
-        return n
+    """Fast-doubling fibonacci (O(log n)) for testing loops."""
+    # a, b = F(k), F(k+1); each bit of n doubles k, plus one if the bit is set
     a, b = 0, 1
-    for i in range(2, n + 1):
-        a, b = b, a + b
-    return b
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
 
 
 def process_people(people: List[Person]) -> dict:
     """Process a list of people."""
     adults = []
     minors = []
+    add_adult = adults.append
+    add_minor = minors.append
     
     for person in people:
-        if person.is_adult():
-            adults.append(person.name)
-        else:
-            minors.append(person.name)
+        (add_adult if person.is_adult() else add_minor)(person.name)
     
     return {
         "adults": adults,